@@ -0,0 +1,138 @@
+"""
+Benchmarks the kernels of polyprime.field_kernels against:
+    - "naive": the previous approach (schoolbook product reduced at the end, evaluation by summing
+      c_i * x**i, powering by repeated multiplication)
+    - "barrett": the same algorithms as the kernels, reduced with a Barrett reduction written in
+      Python instead of the built-in %
+
+Comparing the kernels with "naive" measures the gain of the algorithms (Horner's scheme,
+square-and-multiply), while comparing them with "barrett" measures the reduction alone.
+
+Usage:
+    python -m benchmarks.field_kernels
+"""
+import random
+import timeit
+
+from polyprime import field_kernels
+
+GUARD_BITS = 16
+
+
+def naive_convolve(a, b, p):
+    c = [0] * (len(a) + len(b) - 1)
+
+    for i, a_i in enumerate(a):
+        for j, b_j in enumerate(b):
+            c[i + j] += a_i * b_j
+
+    return [c_k % p for c_k in c]
+
+
+def naive_evaluate(coefs, x, p):
+    return sum([c_i * x ** i for i, c_i in enumerate(coefs)]) % p
+
+
+def naive_power(coefs, n, p):
+    result = [1]
+
+    for _ in range(n):
+        result = naive_convolve(result, coefs, p)
+
+    return result
+
+
+class Barrett:
+    def __init__(self, p):
+        self.p = p
+        self.width = 2 * p.bit_length() + GUARD_BITS
+        self.mu = 2 ** self.width // p
+        self.batch_size = (2 ** self.width - p) // (p - 1) ** 2
+
+    def reduce(self, x):
+        r = x - ((x * self.mu) >> self.width) * self.p
+
+        while r >= self.p:
+            r -= self.p
+
+        return r
+
+    def convolve(self, a, b):
+        c = [0] * (len(a) + len(b) - 1)
+        pending = 0
+
+        for i, a_i in enumerate(a):
+            for j, b_j in enumerate(b):
+                c[i + j] += a_i * b_j
+
+            pending += 1
+
+            if pending == self.batch_size:
+                c = [self.reduce(c_k) for c_k in c]
+                pending = 0
+
+        return [self.reduce(c_k) for c_k in c]
+
+    def evaluate(self, coefs, x):
+        value = 0
+
+        for c_i in reversed(coefs):
+            value = self.reduce(value * x + c_i)
+
+        return value
+
+    def power(self, coefs, n):
+        result = [1]
+
+        while n:
+            if n & 1:
+                result = self.convolve(result, coefs)
+
+            n >>= 1
+
+            if n:
+                coefs = self.convolve(coefs, coefs)
+
+        return result
+
+
+def main(degree=64, exponent=32, repeat=7, number=50):
+    for p in [17, 65521, 2 ** 61 - 1, 2 ** 127 - 1]:
+        barrett = Barrett(p)
+        a = [random.randrange(p) for _ in range(degree + 1)]
+        b = [random.randrange(p) for _ in range(degree + 1)]
+        x = random.randrange(p)
+
+        benchmarks = {
+            "mul": (
+                lambda: naive_convolve(a, b, p),
+                lambda: barrett.convolve(a, b),
+                lambda: field_kernels.convolve(a, b, p),
+            ),
+            "eval": (
+                lambda: naive_evaluate(a, x, p),
+                lambda: barrett.evaluate(a, x),
+                lambda: field_kernels.evaluate(a, x, p),
+            ),
+            "pow": (
+                lambda: naive_power(a[:4], exponent, p),
+                lambda: barrett.power(a[:4], exponent),
+                lambda: field_kernels.power(a[:4], exponent, p),
+            ),
+        }
+
+        for name, runs in benchmarks.items():
+            naive_time, barrett_time, kernels_time = (
+                min(timeit.repeat(run, repeat=repeat, number=number)) for run in runs
+            )
+
+            print(
+                f"p={p:<40} {name:<5}",
+                f"naive: {naive_time:.5f}s",
+                f"barrett: {barrett_time:.5f}s",
+                f"kernels: {kernels_time:.5f}s",
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmarks the small field mode (SmallPrimeFieldPolynomial) against PrimeFieldPolynomial, and
+table-driven evaluation (Horner's scheme with multiplications looked up in the log/antilog
+tables) against plain % arithmetic.
+
+Usage:
+    python -m benchmarks.small_field
+"""
+import random
+import timeit
+
+from polyprime.field_kernels import evaluate
+from polyprime.prime_field_polynomial import PrimeFieldPolynomial
+from polyprime.small_field_tables import small_field_tables
+from polyprime.small_prime_field_polynomial import SmallPrimeFieldPolynomial
+
+
+def table_evaluate(tables, coefs, x):
+    log, antilog, p = tables.log, tables.antilog, tables.p
+    log_x = log[x % p]
+    value = 0
+
+    for c_i in reversed(coefs):
+        value = antilog[log[value] + log_x] + c_i
+        if value >= p:
+            value -= p
+
+    return value
+
+
+def main(degree=64, repeat=5, number=50):
+    for p in [17, 257, 65521]:
+        coefs = [random.randrange(p) for _ in range(degree + 1)]
+        other_coefs = [random.randrange(p) for _ in range(degree + 1)]
+        P, Q = PrimeFieldPolynomial(coefs, p), PrimeFieldPolynomial(other_coefs, p)
+        S, T = SmallPrimeFieldPolynomial(coefs, p), SmallPrimeFieldPolynomial(
+            other_coefs, p
+        )
+        tables = small_field_tables(p)
+        x = random.randrange(p)
+
+        benchmarks = {
+            "mul (PrimeFieldPolynomial vs small field mode)": (
+                lambda: P * Q,
+                lambda: S * T,
+            ),
+            "eval (PrimeFieldPolynomial vs small field mode)": (
+                lambda: P(x),
+                lambda: S(x),
+            ),
+            "eval (% arithmetic vs log/antilog tables)": (
+                lambda: evaluate(coefs, x, p),
+                lambda: table_evaluate(tables, coefs, x),
+            ),
+        }
+
+        for name, (reference, contender) in benchmarks.items():
+            reference_time, contender_time = (
+                min(timeit.repeat(run, repeat=repeat, number=number))
+                for run in (reference, contender)
+            )
+
+            print(
+                f"p={p:<6} {name:<48}",
+                f"{reference_time:.5f}s vs {contender_time:.5f}s",
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,480 @@
+import collections
+import itertools
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from polyprime import field_kernels
+from polyprime.miller_rabin import prime as is_prime
+
+TYPECODES = {1: "B", 2: "H", 4: "I", 8: "Q"}
+
+OPERATIONS = ("add", "mul", "eval", "pow")
+
+
+def value_width(p: int) -> int:
+    """
+    Returns the number of bytes needed to store an integer modulo p, rounded up to the size of a
+    machine integer when such an integer is wide enough.
+
+    Example:
+        In [1]: value_width(17), value_width(2**61 - 1), value_width(2**127 - 1)
+        Out[1]: (1, 8, 16)
+    """
+    width = max(1, ((p - 1).bit_length() + 7) // 8)
+
+    return next((size for size in TYPECODES if width <= size), width)
+
+
+class SharedColumn:
+    """
+    Class for packing a column of integer vectors modulo p (e.g. the coefs of a batch of
+    polynomials) into a shared memory block, so that worker processes can read and write them
+    without pickling.
+
+    Every vector has a fixed capacity and a length (at most its capacity, e.g. the length of a
+    result once trimmed). The block is laid out as
+
+        [count, offset_0, ..., offset_count, length_0, ..., length_(count-1), values...]
+
+    where the header entries are unsigned 64-bit integers, the i-th vector is stored from
+    values[offset_i] on with a capacity of offset_(i+1) - offset_i values, and each value takes
+    width bytes.
+
+    Example:
+        In [1]: column = SharedColumn.create(capacities=[2, 0, 3], width=1)
+
+        In [2]: column.fill([[1, 2], [], [3]])
+
+        In [3]: column.tolist()
+        Out[3]: [[1, 2], [], [3]]
+    """
+
+    def __init__(self, shm: SharedMemory, width: int):
+        self.shm = shm
+        self.width = width
+
+        count = array("Q", bytes(shm.buf[:8]))[0]
+        lengths_start = 8 * (count + 2)
+        start = 8 * (2 * count + 2)
+        self.offsets = shm.buf[8:lengths_start].cast("Q")
+        self.lengths = shm.buf[lengths_start:start].cast("Q")
+        stop = start + self.offsets[count] * width
+
+        self.values = (
+            shm.buf[start:stop].cast(TYPECODES[width])
+            if width in TYPECODES
+            else shm.buf[start:stop]
+        )
+
+    @classmethod
+    def create(
+        cls,
+        capacities: Sequence[int],
+        width: int,
+        values: Optional[Iterable[int]] = None,
+    ) -> "SharedColumn":
+        """
+        Creates a shared column of vectors with the given capacities, filled with values (the
+        concatenation of all the vectors, each one at full capacity) when provided.
+
+        Raises OverflowError (before allocating any shared memory) if a value is negative or does
+        not fit in width bytes.
+        """
+        payload = None if values is None else cls.encode(values, width)
+        offsets = [0] + list(itertools.accumulate(capacities))
+        header = array("Q", [len(capacities)] + offsets + list(capacities)).tobytes()
+        shm = SharedMemory(create=True, size=len(header) + offsets[-1] * width)
+        shm.buf[: len(header)] = header
+
+        column = cls(shm, width)
+
+        if payload is not None:
+            column.values[:] = payload
+
+        return column
+
+    @classmethod
+    def attach(cls, name: str, width: int) -> "SharedColumn":
+        return cls(SharedMemory(name=name), width)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def __len__(self) -> int:
+        return len(self.lengths)
+
+    def read_values(self) -> List[int]:
+        if self.width in TYPECODES:
+            return self.values.tolist()
+
+        raw = bytes(self.values)
+        return [
+            int.from_bytes(raw[start:end], "little")
+            for start, end in zip(
+                range(0, len(raw), self.width),
+                range(self.width, len(raw) + 1, self.width),
+            )
+        ]
+
+    @staticmethod
+    def encode(values: Iterable[int], width: int) -> Union[array, bytes]:
+        if width in TYPECODES:
+            return array(TYPECODES[width], values)
+
+        return b"".join(v.to_bytes(width, "little") for v in values)
+
+    def tolist(self) -> List[List[int]]:
+        """
+        Returns the vectors of the column (each one cut to its length).
+        """
+        values = self.read_values()
+        ends = map(sum, zip(self.offsets, self.lengths))
+
+        return [values[start:end] for start, end in zip(self.offsets, ends)]
+
+    def fill(self, vectors: List[List[int]]):
+        """
+        Writes the vectors into the column (each one being at most as long as its capacity) and
+        records their lengths.
+        """
+        capacities = [end - start for start, end in zip(self.offsets, self.offsets[1:])]
+        values = itertools.chain.from_iterable(
+            itertools.chain(vector, itertools.repeat(0, capacity - len(vector)))
+            for vector, capacity in zip(vectors, capacities)
+        )
+
+        self.lengths[:] = array("Q", map(len, vectors))
+        self.values[:] = self.encode(values, self.width)
+
+    def close(self):
+        self.offsets.release()
+        self.lengths.release()
+        self.values.release()
+        self.shm.close()
+
+    def unlink(self):
+        self.close()
+        self.shm.unlink()
+
+
+def trimmed(vector: List[int]) -> List[int]:
+    """
+    Returns the vector without its trailing zeroes (a cheaper equivalent of
+    polyprime.list_utils.trim_trailing_zeroes for vectors that rarely end with zeroes).
+    """
+    end = len(vector)
+
+    while end and vector[end - 1] == 0:
+        end -= 1
+
+    return vector if end == len(vector) else vector[:end]
+
+
+def output_capacities(operation: str, lengths: List[List[int]], n: int) -> List[int]:
+    """
+    Returns the numbers of coefs of the results of an operation on a chunk of polynomials, given
+    the numbers of coefs of the polynomials of each input column (the results being trimmed
+    afterwards, these are only upper bounds).
+    """
+    if operation == "add":
+        return list(map(max, *lengths))
+
+    if operation == "mul":
+        return [a + b - 1 if a and b else 0 for a, b in zip(*lengths)]
+
+    if operation == "eval" or n == 0:
+        return [1] * len(lengths[0])
+
+    return [(a - 1) * n + 1 if a else 0 for a in lengths[0]]
+
+
+def compute(
+    operation: str, p: int, n: int, columns: List[List[List[int]]]
+) -> List[List[int]]:
+    """
+    Computes an operation on columns of (reduced) coefs of polynomials over Z/pZ (the points of
+    evaluation being given as one-value vectors for "eval") and returns the column of trimmed
+    results (one-value vectors for "eval").
+
+    Multiplications, evaluations and powers run the kernels of polyprime.field_kernels row by row:
+    in CPython, a column-wise Horner's scheme (one comprehension over the whole column per step)
+    measured slower than evaluating each row, and products do not reduce to such a form.
+    """
+    if operation == "add":
+        return [
+            trimmed(
+                [
+                    (a_i + b_i) % p
+                    for a_i, b_i in itertools.zip_longest(P, Q, fillvalue=0)
+                ]
+            )
+            for P, Q in zip(*columns)
+        ]
+
+    if operation == "mul":
+        return [trimmed(field_kernels.convolve(P, Q, p)) for P, Q in zip(*columns)]
+
+    if operation == "eval":
+        return [[field_kernels.evaluate(P, x, p)] for P, (x,) in zip(*columns)]
+
+    return [trimmed(field_kernels.power(P, n, p)) for P in columns[0]]
+
+
+def process_chunk(
+    operation: str, p: int, n: int, input_names: List[str], output_name: str, width: int
+):
+    """
+    Reduces a chunk of shared input columns modulo p, computes an operation on them and fills the
+    shared output column with the trimmed results (meant to run in worker processes).
+    """
+    inputs = [SharedColumn.attach(name, width) for name in input_names]
+    output = SharedColumn.attach(output_name, width)
+
+    try:
+        columns = [
+            [[c % p for c in vector] for vector in column.tolist()] for column in inputs
+        ]
+        output.fill(compute(operation, p, n, columns))
+    finally:
+        for column in inputs + [output]:
+            column.close()
+
+
+def stream(
+    operation: str,
+    jobs: Iterable[Tuple[Sequence[int], ...]],
+    p: int,
+    n: int = 0,
+    processes: int = 1,
+    chunk_size: int = 1024,
+    max_pending_chunks: Optional[int] = None,
+) -> Iterator[Union[List[int], int]]:
+    """
+    Lazily computes an operation ("add", "mul", "eval" or "pow") on a stream of independent jobs
+    over Z/pZ, each job being a tuple of coefs vectors (P, Q) for "add" and "mul", a coefs vector
+    and a point (P, x) for "eval", and a 1-tuple (P,) for "pow" (raising P to the n-th power).
+
+    Jobs are processed by chunks of chunk_size. When processes > 1, every chunk is packed into
+    shared memory blocks and dispatched to a pool of as many worker processes, so that no coefs
+    get pickled on the way in or out. The parent process packs the coefs as they are (only
+    reducing them modulo p when some do not fit in the shared blocks), the workers reducing the
+    coefs and trimming the results. Results are yielded in the order of the jobs
+    (as trimmed coefs, or as integers for "eval"), and at most max_pending_chunks chunks
+    (2 * processes by default) are in flight at any time, so that the jobs are consumed no faster
+    than the results.
+
+    Example:
+        In [1]: list(stream("mul", [([1, 1], [16, 1]), ([2], [3])], p=17))
+        Out[1]: [[16, 0, 1], [6]]
+    """
+    assert operation in OPERATIONS, f"operation must be one of {', '.join(OPERATIONS)}."
+    assert isinstance(p, int) and is_prime(p), "p must be prime."
+    assert isinstance(n, int) and 0 <= n, "n must be a positive integer"
+
+    width = value_width(p)
+    max_pending_chunks = max_pending_chunks or 2 * processes
+
+    def as_list(vector):
+        # NumPy arrays (and their scalars) are converted to Python numbers in one go:
+        return vector.tolist() if hasattr(vector, "tolist") else vector
+
+    def columns_of(chunk):
+        columns = [[as_list(vector) for vector in column] for column in zip(*chunk)]
+
+        if operation == "eval" and columns:
+            assert all(
+                isinstance(x, int) for x in columns[1]
+            ), "Points of evaluation must all be integers."
+            columns[1] = [[x] for x in columns[1]]
+
+        assert all(
+            isinstance(c, int)
+            for column in columns
+            for vector in column
+            for c in vector
+        ), "Polynomial coefs must all be integers."
+
+        return columns
+
+    def results_of(column):
+        return [value for value, in column] if operation == "eval" else column
+
+    jobs = iter(jobs)
+    chunks = iter(lambda: columns_of(list(itertools.islice(jobs, chunk_size))), [])
+
+    if processes == 1:
+        for columns in chunks:
+            reduced = [
+                [[c % p for c in vector] for vector in column] for column in columns
+            ]
+            yield from results_of(compute(operation, p, n, reduced))
+        return
+
+    def submit(executor, columns):
+        inputs = []
+        output = None
+
+        try:
+            lengths = [list(map(len, column)) for column in columns]
+
+            for column, column_lengths in zip(columns, lengths):
+                values = list(itertools.chain.from_iterable(column))
+
+                try:
+                    inputs.append(
+                        SharedColumn.create(column_lengths, width, values=values)
+                    )
+                except OverflowError:  # negative or too wide values
+                    values = [c % p for c in values]
+                    inputs.append(
+                        SharedColumn.create(column_lengths, width, values=values)
+                    )
+
+            output = SharedColumn.create(
+                output_capacities(operation, lengths, n), width
+            )
+
+            future = executor.submit(
+                process_chunk,
+                operation,
+                p,
+                n,
+                [column.name for column in inputs],
+                output.name,
+                width,
+            )
+        except BaseException:
+            for column in inputs + ([output] if output else []):
+                column.unlink()
+            raise
+
+        return future, inputs, output
+
+    def collect(future, inputs, output):
+        try:
+            future.result()
+            return results_of(output.tolist())
+        finally:
+            for column in inputs + [output]:
+                column.unlink()
+
+    pending = collections.deque()
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        try:
+            for columns in chunks:
+                pending.append(submit(executor, columns))
+
+                if len(pending) == max_pending_chunks:
+                    yield from collect(*pending.popleft())
+
+            while pending:
+                yield from collect(*pending.popleft())
+        finally:
+            while pending:
+                future, inputs, output = pending.popleft()
+                if not future.cancel():
+                    future.exception()  # waits for the running chunk to release its blocks
+                for column in inputs + [output]:
+                    column.unlink()
+
+
+def add(
+    P_coefs: Sequence[Sequence[int]],
+    Q_coefs: Sequence[Sequence[int]],
+    p: int,
+    **options,
+) -> List[List[int]]:
+    """
+    Returns the coefs of the sums P + Q for every pair (P, Q) of polynomials over Z/pZ given by
+    the columns P_coefs and Q_coefs (lists or NumPy arrays of coefs vectors).
+
+    Example:
+        In [1]: add([[1, 1], [3]], [[16, 1], [14]], p=17)
+        Out[1]: [[0, 2], []]
+    """
+    assert len(P_coefs) == len(
+        Q_coefs
+    ), "P_coefs and Q_coefs must have the same length."
+
+    return list(stream("add", zip(P_coefs, Q_coefs), p, **options))
+
+
+def mul(
+    P_coefs: Sequence[Sequence[int]],
+    Q_coefs: Sequence[Sequence[int]],
+    p: int,
+    **options,
+) -> List[List[int]]:
+    """
+    Returns the coefs of the products P * Q for every pair (P, Q) of polynomials over Z/pZ given
+    by the columns P_coefs and Q_coefs (lists or NumPy arrays of coefs vectors).
+
+    Example:
+        In [1]: mul([[1, 1], [2]], [[16, 1], [3]], p=17)
+        Out[1]: [[16, 0, 1], [6]]
+    """
+    assert len(P_coefs) == len(
+        Q_coefs
+    ), "P_coefs and Q_coefs must have the same length."
+
+    return list(stream("mul", zip(P_coefs, Q_coefs), p, **options))
+
+
+def evaluate(
+    P_coefs: Sequence[Sequence[int]], xs: Sequence[int], p: int, **options
+) -> List[int]:
+    """
+    Returns the values P(x) for every pair (P, x) of a polynomial over Z/pZ and an integer given
+    by the columns P_coefs (list or NumPy array of coefs vectors) and xs.
+
+    Example:
+        In [1]: evaluate([[3, 0, 1], [3, 0, 1]], [1, 2], p=17)
+        Out[1]: [4, 7]
+    """
+    assert len(P_coefs) == len(xs), "P_coefs and xs must have the same length."
+
+    return list(stream("eval", zip(P_coefs, xs), p, **options))
+
+
+def power(
+    P_coefs: Iterable[Sequence[int]], n: int, p: int, **options
+) -> List[List[int]]:
+    """
+    Returns the coefs of the n-th powers P**n for every polynomial P over Z/pZ given by the column
+    P_coefs (list or NumPy array of coefs vectors).
+
+    Example:
+        In [1]: power([[1, 1], [2]], 2, p=17)
+        Out[1]: [[1, 2, 1], [4]]
+    """
+    return list(stream("pow", zip(P_coefs), p, n=n, **options))
+
+
+def prime(
+    ns: Iterable[int], t: int = 10, processes: int = 1, chunk_size: int = 1024
+) -> List[bool]:
+    """
+    Tests the primality of every integer of ns according to Miller-Rabin's test (cf.
+    polyprime.miller_rabin.prime), dispatching them by chunks to a pool of worker processes when
+    processes > 1.
+
+    Example:
+        In [1]: prime([2, 17, 18, 2**61 - 1])
+        Out[1]: [True, True, False, True]
+    """
+    # NumPy arrays are converted to Python numbers in one go:
+    ns = ns.tolist() if hasattr(ns, "tolist") else list(ns)
+
+    assert all(isinstance(n, int) for n in ns), "ns must all be integers."
+
+    ts = itertools.repeat(t, len(ns))
+
+    if processes == 1:
+        return list(map(is_prime, ns, ts))
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        return list(executor.map(is_prime, ns, ts, chunksize=chunk_size))
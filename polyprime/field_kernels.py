@@ -0,0 +1,67 @@
+from typing import List
+
+
+def convolve(a: List[int], b: List[int], p: int) -> List[int]:
+    """
+    Returns the coefs of the product of the polynomials over Z/pZ whose (reduced) coefs are a and
+    b, accumulating the products a_i * b_j at full width and reducing every coef once at the end.
+
+    Example:
+        In [1]: convolve([1, 1], [16, 1], p=17)  # (X + 1) * (X - 1)
+        Out[1]: [16, 0, 1]
+    """
+    if not a or not b:
+        return []
+
+    c = [0] * (len(a) + len(b) - 1)
+
+    for i, a_i in enumerate(a):
+        if a_i == 0:
+            continue
+
+        for j, b_j in enumerate(b):
+            c[i + j] += a_i * b_j
+
+    return [c_k % p for c_k in c]
+
+
+def evaluate(coefs: List[int], x: int, p: int) -> int:
+    """
+    Evaluates the polynomial over Z/pZ whose (reduced) coefs are coefs on the integer x according
+    to Horner's scheme, reducing with the built-in % at each step (which, in CPython, outperforms
+    a Barrett reduction written in Python, cf. benchmarks/field_kernels.py).
+
+    Example:
+        In [1]: evaluate([3, 0, 1], 2, p=17)  # X**2 + 3 evaluated on 2
+        Out[1]: 7
+    """
+    x %= p
+    value = 0
+
+    for c_i in reversed(coefs):
+        value = (value * x + c_i) % p
+
+    return value
+
+
+def power(coefs: List[int], n: int, p: int) -> List[int]:
+    """
+    Returns the coefs of the n-th power of the polynomial over Z/pZ whose (reduced) coefs are
+    coefs, by means of square-and-multiply.
+
+    Example:
+        In [1]: power([1, 1], 2, p=17)  # (X + 1)**2
+        Out[1]: [1, 2, 1]
+    """
+    result = [1]
+
+    while n:
+        if n & 1:
+            result = convolve(result, coefs, p)
+
+        n >>= 1
+
+        if n:
+            coefs = convolve(coefs, coefs, p)
+
+    return result
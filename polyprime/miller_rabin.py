@@ -54,5 +54,8 @@ def prime(n: int, t: int = 10) -> bool:
     Reference: cf. the description of the Miller-Rabin test right below Example 2.10 (page 4) in
     miller-rabin.pdf.
     """
+    if n < 4:  # no witness candidates in [2, n-2]
+        return n in (2, 3)
+
     witness_candidates = [random.randint(2, n - 2) for _ in range(t + 1)]
     return not any([miller_rabin_witness(n, a) for a in witness_candidates])
@@ -1,5 +1,6 @@
 from typing import Union
 
+from polyprime.field_kernels import convolve, evaluate, power
 from polyprime.list_utils import dropwhile, long_zip_with, reverse, trim_trailing_zeroes
 from polyprime.miller_rabin import prime
 
@@ -32,6 +33,19 @@ class PrimeFieldPolynomial:
         self.coefs = trim_trailing_zeroes([c_i % p for c_i in coefs])
         self.p = p
 
+    @classmethod
+    def _from_reduced(cls, coefs: list, p: int) -> "PrimeFieldPolynomial":
+        """
+        Instantiates a PrimeFieldPolynomial from coefs already reduced modulo p (as output by the
+        kernels of polyprime.field_kernels), skipping the validation and reduction of coefs
+        and the primality test of p (which is already known to be prime).
+        """
+        polynomial = cls.__new__(cls)
+        polynomial.coefs = trim_trailing_zeroes(coefs)
+        polynomial.p = p
+
+        return polynomial
+
     @classmethod
     def X(cls, p: int) -> "PrimeFieldPolynomial":
         return cls(coefs=[0, 1], p=p)
@@ -78,11 +92,9 @@ class PrimeFieldPolynomial:
         assert isinstance(other, int)
 
         if self == 0:
-            return PrimeFieldPolynomial(coefs=[other], p=self.p)
+            return self.__class__(coefs=[other], p=self.p)
 
-        return PrimeFieldPolynomial(
-            coefs=[self.coefs[0] + other] + self.coefs[1:], p=self.p
-        )
+        return self.__class__(coefs=[self.coefs[0] + other, *self.coefs[1:]], p=self.p)
 
     def __rsub__(self, other: int) -> "PrimeFieldPolynomial":
         """
@@ -92,9 +104,9 @@ class PrimeFieldPolynomial:
         assert isinstance(other, int)
 
         if self == 0:
-            return PrimeFieldPolynomial(coefs=[other], p=self.p)
+            return self.__class__(coefs=[other], p=self.p)
 
-        return PrimeFieldPolynomial(
+        return self.__class__(
             coefs=[other - self.coefs[0]] + [-c_i for c_i in self.coefs[1:]], p=self.p
         )
 
@@ -106,9 +118,9 @@ class PrimeFieldPolynomial:
         assert isinstance(n, int)
 
         if n == 0:
-            return PrimeFieldPolynomial(coefs=[], p=self.p)
+            return self.__class__(coefs=[], p=self.p)
 
-        return PrimeFieldPolynomial(coefs=[n * c_i for c_i in self.coefs], p=self.p)
+        return self.__class__(coefs=[n * c_i for c_i in self.coefs], p=self.p)
 
     def __add__(
         self, other: Union["PrimeFieldPolynomial", int]
@@ -132,7 +144,7 @@ class PrimeFieldPolynomial:
             [self.coefs, other.coefs]
         )
 
-        return PrimeFieldPolynomial(coefs=sum_coefs, p=self.p)
+        return self.__class__(coefs=sum_coefs, p=self.p)
 
     def __sub__(
         self, other: Union["PrimeFieldPolynomial", int]
@@ -146,11 +158,11 @@ class PrimeFieldPolynomial:
                 return -other
             else:
                 assert isinstance(other, int)
-                return PrimeFieldPolynomial(coefs=[-other], p=self.p)
+                return self.__class__(coefs=[-other], p=self.p)
 
         if isinstance(other, int):
-            return PrimeFieldPolynomial(
-                coefs=[self.coefs[0] - other] + self.coefs[1:], p=self.p
+            return self.__class__(
+                coefs=[self.coefs[0] - other, *self.coefs[1:]], p=self.p
             )
 
         assert isinstance(other, PrimeFieldPolynomial)
@@ -165,7 +177,7 @@ class PrimeFieldPolynomial:
             [self.coefs, other.coefs]
         )
 
-        return PrimeFieldPolynomial(coefs=sub_coefs, p=self.p)
+        return self.__class__(coefs=sub_coefs, p=self.p)
 
     def __mul__(
         self, other: Union["PrimeFieldPolynomial", int]
@@ -182,13 +194,9 @@ class PrimeFieldPolynomial:
             other.p == self.p
         ), "Polynomials must be defined over the same prime field to be multiplied."
 
-        mul_coefs = [0] * (self.degree + other.degree + 1)
+        mul_coefs = convolve(self.coefs, other.coefs, self.p)
 
-        for i, a_i in enumerate(self.coefs):
-            for j, b_j in enumerate(other.coefs):
-                mul_coefs[i + j] += a_i * b_j
-
-        return PrimeFieldPolynomial(coefs=mul_coefs, p=self.p)
+        return self._from_reduced(coefs=mul_coefs, p=self.p)
 
     def __pow__(self, n: int) -> "PrimeFieldPolynomial":
         """
@@ -196,10 +204,9 @@ class PrimeFieldPolynomial:
         """
         assert isinstance(n, int) and 0 <= n, "n must be a positive integer"
 
-        if n == 0:
-            return PrimeFieldPolynomial([1], p=self.p)
+        pow_coefs = power(self.coefs, n, self.p)
 
-        return self ** (n - 1) * self
+        return self._from_reduced(coefs=pow_coefs, p=self.p)
 
     def __neg__(self) -> "PrimeFieldPolynomial":
         """
@@ -247,4 +254,4 @@ class PrimeFieldPolynomial:
         if self.degree == 0:
             return self.coefs[0]
 
-        return sum([c_i * x ** i for i, c_i in enumerate(self.coefs)]) % self.p
+        return evaluate(self.coefs, x, self.p)
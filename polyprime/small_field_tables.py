@@ -0,0 +1,111 @@
+import functools
+from array import array
+from typing import List
+
+SMALL_FIELD_BOUND = 2 ** 16
+
+
+def prime_factors(n: int) -> List[int]:
+    """
+    Returns the distinct prime factors of the integer n by trial division (only meant for small n).
+
+    Example:
+        In [1]: prime_factors(16)
+        Out[1]: [2]
+
+        In [2]: prime_factors(60)
+        Out[2]: [2, 3, 5]
+    """
+    factors = []
+    d = 2
+
+    while d * d <= n:
+        if n % d == 0:
+            factors.append(d)
+            while n % d == 0:
+                n //= d
+        d += 1
+
+    return factors + [n] if n > 1 else factors
+
+
+def primitive_root(p: int) -> int:
+    """
+    Returns the smallest generator of the multiplicative group of Z/pZ with p prime.
+
+    Example:
+        In [1]: primitive_root(17)
+        Out[1]: 3
+    """
+    if p == 2:
+        return 1
+
+    factors = prime_factors(p - 1)
+
+    return next(
+        g for g in range(2, p) if all(pow(g, (p - 1) // q, p) != 1 for q in factors)
+    )
+
+
+class SmallFieldTables:
+    """
+    Class gathering the lookup tables (discrete logarithms, inverses) of a small prime field Z/pZ
+    (p < 2**16), stored as compact arrays.
+
+    The tables answer in O(1) the questions plain % arithmetic cannot answer cheaply:
+        - inverse[a] = a**(-1) for a != 0 (and inverse[0] = 0), e.g. to divide by a coef (such as
+          the leading coef of a polynomial to make it monic) without an extended Euclid or a
+          modular exponentiation
+        - log[a] = e such that g**e = a for a != 0, with g a primitive root modulo p, e.g. to get
+          the multiplicative order of a, namely (p-1) / gcd(log[a], p-1), or to tell whether a is a
+          k-th power (iff gcd(k, p-1) divides log[a])
+        - antilog[e] = g**e for 0 <= e < 2(p-1) (and 0 beyond), i.e. the powers of g
+
+    They do not speed up polynomial arithmetic though: in CPython, gathering products from the
+    antilog table (a*b = antilog[log a + log b], log[0] = 2(p-1) sending every product involving 0
+    onto the zero tail of antilog) is slower than multiplying small integers and reducing them
+    with % (cf. benchmarks/small_field.py).
+
+    Example:
+        In [1]: P = SmallPrimeFieldPolynomial(coefs=[1, 0, 5], p=17)
+
+        In [2]: P.tables.inverse[P.coefs[-1]] * P  # the monic polynomial associated with P
+        Out[2]: X**2 + 7
+
+        In [3]: tables = SmallFieldTables(p=17)
+
+        In [4]: (17 - 1) // math.gcd(tables.log[4], 17 - 1)  # the multiplicative order of 4
+        Out[4]: 4
+    """
+
+    def __init__(self, p: int):
+        assert (
+            isinstance(p, int) and 2 <= p < SMALL_FIELD_BOUND
+        ), "p must be lower than 2**16 in small field mode."
+
+        self.p = p
+        n = p - 1
+        self.generator = primitive_root(p)
+
+        self.antilog = array("H", [0]) * (4 * n + 1)
+        x = 1
+        for e in range(n):
+            self.antilog[e] = self.antilog[e + n] = x
+            x = x * self.generator % p
+
+        self.log = array("L", [2 * n]) * p
+        for e in range(n):
+            self.log[self.antilog[e]] = e
+
+        self.inverse = array("H", [0]) * p
+        for a in range(1, p):
+            self.inverse[a] = self.antilog[(n - self.log[a]) % n]
+
+
+@functools.lru_cache(maxsize=16)
+def small_field_tables(p: int) -> SmallFieldTables:
+    """
+    Returns the (cached) SmallFieldTables of the prime field Z/pZ, the least recently used tables
+    being evicted once 16 small fields are cached.
+    """
+    return SmallFieldTables(p)
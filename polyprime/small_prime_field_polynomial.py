@@ -0,0 +1,87 @@
+from array import array
+from typing import Union
+
+from polyprime.field_kernels import evaluate
+from polyprime.list_utils import dropwhile
+from polyprime.prime_field_polynomial import PrimeFieldPolynomial
+from polyprime.small_field_tables import (
+    SMALL_FIELD_BOUND,
+    SmallFieldTables,
+    small_field_tables,
+)
+
+
+class SmallPrimeFieldPolynomial(PrimeFieldPolynomial):
+    """
+    Class for instantiating polynomials over small prime fields Z/pZ (p < 2**16), whose coefs
+    are stored as compact array('H') (2 bytes per coef instead of a pointer to an int object) and
+    which give access to the (cached) lookup tables of Z/pZ.
+
+    Opt-in drop-in replacement for PrimeFieldPolynomial, saving memory only: arithmetic runs the
+    same kernels as PrimeFieldPolynomial since, in CPython, table-driven arithmetic is slower than
+    plain % arithmetic on small integers, and reading coefs back out of the array even costs a
+    little for larger p (cf. benchmarks/small_field.py).
+
+    Example:
+        In [1]: X = SmallPrimeFieldPolynomial.X(p=17)
+
+        In [2]: P = X**2 + 3
+
+        In [3]: P.coefs
+        Out[3]: array('H', [3, 0, 1])
+
+        In [4]: P.evaluate_everywhere()
+        Out[4]: array('H', [3, 4, 7, 12, 2, 11, 5, 1, 16, 16, 1, 5, 11, 2, 12, 7, 4])
+    """
+
+    def __init__(self, coefs: list, p: int):
+        assert (
+            isinstance(p, int) and p < SMALL_FIELD_BOUND
+        ), "p must be lower than 2**16 in small field mode."
+
+        super().__init__(coefs, p)
+
+        self.coefs = array("H", self.coefs)
+
+    @classmethod
+    def _from_reduced(cls, coefs: list, p: int) -> "SmallPrimeFieldPolynomial":
+        polynomial = super()._from_reduced(coefs, p)
+        polynomial.coefs = array("H", polynomial.coefs)
+
+        return polynomial
+
+    @property
+    def is_monomial(self) -> bool:
+        return (
+            1 <= self.degree
+            and len(dropwhile(lambda x: x == 0)(self.coefs.tolist())) == 1
+        )
+
+    def __eq__(self, other: Union[PrimeFieldPolynomial, int]) -> bool:
+        """
+        Implements equality between a SmallPrimeFieldPolynomial and another (Small)
+        PrimeFieldPolynomial or an integer, comparing array coefs as lists.
+        """
+        if isinstance(other, PrimeFieldPolynomial):
+            assert (
+                self.p == other.p
+            ), "Polynomials must be defined over the same prime field to be compared for equality."
+
+            return self.coefs.tolist() == list(other.coefs)
+
+        return super().__eq__(other)
+
+    @property
+    def tables(self) -> SmallFieldTables:
+        """
+        Returns the (cached) lookup tables (discrete logarithms, inverses) of Z/pZ, e.g. to invert
+        coefs (cf. polyprime.small_field_tables.SmallFieldTables).
+        """
+        return small_field_tables(self.p)
+
+    def evaluate_everywhere(self) -> array:
+        """
+        Evaluates a SmallPrimeFieldPolynomial P on every element of Z/pZ (i.e. returns
+        [P(0), P(1), ..., P(p-1)] as a compact array('H')).
+        """
+        return array("H", [evaluate(self.coefs, x, self.p) for x in range(self.p)])
@@ -0,0 +1,164 @@
+import itertools
+import random
+
+import pytest
+
+from polyprime import batch
+from polyprime.prime_field_polynomial import PrimeFieldPolynomial
+
+PRIMES = [17, 65521, 2 ** 61 - 1, 2 ** 127 - 1]
+
+
+def random_coefs(p, count=50):
+    return [
+        [random.randrange(-p, p) for _ in range(random.randrange(6))]
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.parametrize("p", PRIMES)
+@pytest.mark.parametrize("processes", [1, 2])
+def test_batch_operations(p, processes):
+    P_coefs, Q_coefs = random_coefs(p), random_coefs(p)
+    xs = [random.randrange(-(p ** 2), p ** 2) for _ in P_coefs]
+    Ps = [PrimeFieldPolynomial(coefs, p) for coefs in P_coefs]
+    Qs = [PrimeFieldPolynomial(coefs, p) for coefs in Q_coefs]
+    options = dict(processes=processes, chunk_size=7)
+
+    assert batch.add(P_coefs, Q_coefs, p, **options) == [
+        (P + Q).coefs for P, Q in zip(Ps, Qs)
+    ]
+    assert batch.mul(P_coefs, Q_coefs, p, **options) == [
+        (P * Q).coefs for P, Q in zip(Ps, Qs)
+    ]
+    assert batch.evaluate(P_coefs, xs, p, **options) == [P(x) for P, x in zip(Ps, xs)]
+    assert batch.power(P_coefs, 3, p, **options) == [(P ** 3).coefs for P in Ps]
+    assert batch.power(P_coefs, 0, p, **options) == [[1]] * len(Ps)
+
+
+@pytest.mark.parametrize("p", [17, 2 ** 61 - 1])
+@pytest.mark.parametrize("processes", [1, 2])
+def test_batch_operations_on_numpy_arrays(p, processes):
+    np = pytest.importorskip("numpy")
+
+    P_coefs = np.array([[1, 1, 0], [3, 0, 1], [2 ** 64 - 1, p, p + 1]], dtype=np.uint64)
+    Q_coefs = np.array([[-1, 1, 0], [0, 1, 2], [-(2 ** 63), -p, -1]], dtype=np.int64)
+    xs = np.array([2, -1, 2 ** 63 - 1], dtype=np.int64)
+    Ps = [PrimeFieldPolynomial([int(c) for c in coefs], p) for coefs in P_coefs]
+    Qs = [PrimeFieldPolynomial([int(c) for c in coefs], p) for coefs in Q_coefs]
+    options = dict(processes=processes, chunk_size=2)
+
+    assert batch.add(P_coefs, Q_coefs, p, **options) == [
+        (P + Q).coefs for P, Q in zip(Ps, Qs)
+    ]
+    assert batch.mul(P_coefs, Q_coefs, p, **options) == [
+        (P * Q).coefs for P, Q in zip(Ps, Qs)
+    ]
+    assert batch.evaluate(P_coefs, xs, p, **options) == [
+        P(int(x)) for P, x in zip(Ps, xs)
+    ]
+    assert batch.evaluate(Q_coefs, xs, p, **options) == [
+        Q(int(x)) for Q, x in zip(Qs, xs)
+    ]
+    assert batch.power(Q_coefs, 3, p, **options) == [(Q ** 3).coefs for Q in Qs]
+    assert batch.mul(P_coefs[:2], Q_coefs[:2], p=17, **options) == [
+        [16, 0, 1],
+        [0, 3, 6, 1, 2],
+    ]
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_batch_operations_on_non_integer_numpy_arrays(processes):
+    np = pytest.importorskip("numpy")
+
+    with pytest.raises(AssertionError, match="Polynomial coefs must all be integers."):
+        batch.mul(np.array([[1.5, 2]]), np.array([[1, 1]]), p=17, processes=processes)
+
+    with pytest.raises(
+        AssertionError, match="Points of evaluation must all be integers."
+    ):
+        batch.evaluate(np.array([[1, 2]]), np.array([0.5]), p=17, processes=processes)
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_stream_applies_backpressure(processes):
+    consumed = itertools.count()
+
+    def jobs():
+        for i in range(1000):
+            next(consumed)
+            yield [i + 1], [1, 1]
+
+    results = batch.stream(
+        "mul", jobs(), p=17, processes=processes, chunk_size=10, max_pending_chunks=2
+    )
+
+    assert next(results) == [1, 1]
+    assert next(consumed) <= 2 * 10
+
+    results.close()
+
+
+@pytest.mark.parametrize("width", [1, 8, 16])
+def test_shared_column_with_many_rows(width):
+    vectors = [[i % 256] * (i % 3) for i in range(1000)]
+    column = batch.SharedColumn.create(
+        [len(vector) for vector in vectors],
+        width,
+        values=itertools.chain.from_iterable(vectors),
+    )
+
+    try:
+        assert len(column) == len(vectors)
+        assert column.tolist() == vectors
+    finally:
+        column.unlink()
+
+
+def test_shared_column_records_lengths():
+    column = batch.SharedColumn.create(capacities=[2, 0, 3], width=16)
+
+    try:
+        column.fill([[1, 2 ** 127 - 2], [], [3]])
+
+        assert column.tolist() == [[1, 2 ** 127 - 2], [], [3]]
+    finally:
+        column.unlink()
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_batch_prime(processes):
+    ns = [2 ** 61 - 1, 2 ** 67 - 1, 17, 18, 65521, 0, 1, 2, 3, 4]
+    expected = [True, False, True, False, True, False, False, True, True, False]
+
+    assert batch.prime(ns, processes=processes) == expected
+
+
+def test_batch_prime_on_non_integers():
+    with pytest.raises(AssertionError, match="ns must all be integers."):
+        batch.prime([17.9])
+
+
+@pytest.mark.parametrize(
+    "operation, other_column, message",
+    [
+        (batch.add, [[1]], "P_coefs and Q_coefs must have the same length."),
+        (batch.mul, [[1]], "P_coefs and Q_coefs must have the same length."),
+        (batch.evaluate, [1, 2, 3], "P_coefs and xs must have the same length."),
+    ],
+)
+def test_batch_operations_on_columns_of_different_lengths(
+    operation, other_column, message
+):
+    with pytest.raises(AssertionError, match=message):
+        operation([[1, 2], [3]], other_column, p=17)
+
+
+def test_stream_with_invalid_operation():
+    with pytest.raises(AssertionError, match="operation must be one of"):
+        list(batch.stream("div", [([1], [1])], p=17))
+
+
+def test_stream_over_non_prime_field():
+    with pytest.raises(AssertionError, match="p must be prime."):
+        list(batch.stream("mul", [([1], [1])], p=18))
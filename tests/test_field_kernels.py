@@ -0,0 +1,39 @@
+import random
+
+import pytest
+
+from polyprime.field_kernels import convolve, evaluate, power
+
+PRIMES = [2, 17, 2 ** 61 - 1, 2 ** 127 - 1]
+
+
+@pytest.mark.parametrize("p", PRIMES)
+def test_convolve(p):
+    a = [random.randrange(p) for _ in range(20)]
+    b = [random.randrange(p) for _ in range(30)]
+
+    expected = [0] * (len(a) + len(b) - 1)
+    for i, a_i in enumerate(a):
+        for j, b_j in enumerate(b):
+            expected[i + j] += a_i * b_j
+
+    assert convolve(a, b, p) == [c_k % p for c_k in expected]
+
+
+@pytest.mark.parametrize("p", PRIMES)
+def test_evaluate(p):
+    coefs = [random.randrange(p) for _ in range(20)]
+
+    for x in [0, 1, -1, p, random.randrange(p), -(p ** 3)]:
+        expected = sum(c_i * x ** i for i, c_i in enumerate(coefs)) % p
+        assert evaluate(coefs, x, p) == expected
+
+
+@pytest.mark.parametrize("p", PRIMES)
+def test_power(p):
+    coefs = [random.randrange(p) for _ in range(4)]
+
+    expected = [1]
+    for n in range(10):
+        assert power(coefs, n, p) == expected
+        expected = convolve(expected, coefs, p)
@@ -26,3 +26,10 @@ def test_non_prime(n):
     See https://en.wikipedia.org/wiki/Mersenne_prime#Factorization_of_composite_Mersenne_numbers.
     """
     assert not prime(2 ** n - 1)
+
+
+@pytest.mark.parametrize(
+    "n, expected", [(-7, False), (0, False), (1, False), (2, True), (3, True)]
+)
+def test_prime_on_small_integers(n, expected):
+    assert prime(n) == expected
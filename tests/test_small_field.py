@@ -0,0 +1,118 @@
+import math
+import random
+from array import array
+
+import pytest
+
+from polyprime.prime_field_polynomial import PrimeFieldPolynomial
+from polyprime.small_field_tables import (
+    SmallFieldTables,
+    prime_factors,
+    primitive_root,
+    small_field_tables,
+)
+from polyprime.small_prime_field_polynomial import SmallPrimeFieldPolynomial
+
+PRIMES = [2, 3, 17, 257, 65521]
+
+X = SmallPrimeFieldPolynomial.X(p=17)
+
+
+@pytest.mark.parametrize("p, expected_root", [(2, 1), (3, 2), (17, 3), (65521, 17)])
+def test_primitive_root(p, expected_root):
+    assert primitive_root(p) == expected_root
+
+
+@pytest.mark.parametrize("p", PRIMES)
+def test_tables(p):
+    tables = small_field_tables(p)
+
+    for a in [random.randrange(p) for _ in range(100)]:
+        b = random.randrange(p)
+
+        assert tables.antilog[tables.log[a] + tables.log[b]] == a * b % p
+
+        if a != 0:
+            assert a * tables.inverse[a] % p == 1
+
+
+@pytest.mark.parametrize("p", [17, 257, 65521])
+def test_evaluate_everywhere_matches_prime_field_polynomial(p):
+    coefs = [random.randrange(p) for _ in range(20)]
+    P, R = SmallPrimeFieldPolynomial(coefs, p), PrimeFieldPolynomial(coefs, p)
+
+    assert P.evaluate_everywhere() == array("H", [R(x) for x in range(p)])
+
+
+@pytest.mark.parametrize("coefs", [[1, 0, 5], [3, 16], [7]])
+def test_making_small_field_polynomial_monic_with_inverse_table(coefs):
+    P = SmallPrimeFieldPolynomial(coefs, p=17)
+    M = P.tables.inverse[P.coefs[-1]] * P
+
+    assert M.coefs[-1] == 1
+    assert M * coefs[-1] == P
+
+
+@pytest.mark.parametrize("p", [17, 257, 65521])
+def test_multiplicative_order_from_log_table(p):
+    tables = small_field_tables(p)
+
+    for a in [random.randrange(1, p) for _ in range(20)]:
+        order = (p - 1) // math.gcd(tables.log[a], p - 1)
+
+        assert pow(a, order, p) == 1
+        assert all(pow(a, order // q, p) != 1 for q in prime_factors(order))
+
+
+def test_small_field_tables_are_cached():
+    assert small_field_tables(17) is small_field_tables(17) is X.tables
+
+
+def test_instantiating_small_field_tables_over_large_field():
+    with pytest.raises(AssertionError, match="p must be lower than 2\\*\\*16"):
+        SmallFieldTables(65537)
+
+
+@pytest.mark.parametrize(
+    "coefs, other_coefs",
+    [([3, 0, 1], [0, 1, 2]), ([], [1, 2]), ([16, 1], [1, 1]), ([5], [0, 0, 0, 7])],
+)
+def test_small_field_polynomial_matches_prime_field_polynomial(coefs, other_coefs):
+    P, Q = (SmallPrimeFieldPolynomial(c, p=17) for c in [coefs, other_coefs])
+    R, S = (PrimeFieldPolynomial(c, p=17) for c in [coefs, other_coefs])
+
+    assert P + Q == R + S
+    assert P - Q == R - S
+    assert P * Q == R * S
+    assert 3 - P == 3 - R
+    assert -P == -R
+    assert P ** 5 == R ** 5
+    assert (P * Q).is_monomial == (R * S).is_monomial
+    assert R * S == P * Q
+    assert str(P * Q) == str(R * S)
+    assert [P(x) for x in range(17)] == [R(x) for x in range(17)]
+
+
+@pytest.mark.parametrize(
+    "P, expected", [(3 * X ** 4, True), (X, True), (X + 1, False), (X - X, False)]
+)
+def test_small_field_polynomial_monomiality(P, expected):
+    assert P.is_monomial == expected
+
+
+@pytest.mark.parametrize("P", [X + 1, X ** 2 - X, 3 * X, 5 - X ** 3, (X + 1) ** 17])
+def test_small_field_polynomial_stays_in_small_field_mode(P):
+    assert isinstance(P, SmallPrimeFieldPolynomial)
+    assert isinstance(P.coefs, array) and P.coefs.typecode == "H"
+
+
+def test_evaluate_everywhere():
+    # X**16 - 1 vanishes on every non-zero element thanks to Fermat's Little Theorem:
+    P = X ** 16 - 1
+
+    assert P.evaluate_everywhere() == array("H", [16] + [0] * 16)
+
+
+def test_instantiating_small_field_polynomial_over_large_field():
+    with pytest.raises(AssertionError, match="p must be lower than 2\\*\\*16"):
+        SmallPrimeFieldPolynomial(coefs=[1, 0, 1], p=65537)